@@ -0,0 +1,22 @@
+# crawl_fmt.pyx
+#
+# Optional compiled helper for pyCrawl. Formats one directory entry into its
+# MAP.txt line and its GUI/log line. This runs once per entry in the crawl
+# loop, so compiling it removes the interpreter dispatch from the hottest
+# string-formatting path. Build with:
+#
+#     pip install cython
+#     python setup.py build_ext --inplace
+#
+# pyCrawl falls back to an identical pure-Python version when the compiled
+# module is not present.
+# cython: language_level=3
+
+cpdef tuple format_entry(int indent_level, bint is_last, str name, bint is_dir):
+    """Return (map_line, gui_text) for one directory entry."""
+    cdef str indent_str = "    " * indent_level
+    cdef str prefix = "└── " if is_last else "├── "
+    cdef str gui_text = "  " + indent_str + prefix + name
+    if is_dir:
+        return "#" + indent_str + prefix + name + "/\n", gui_text
+    return "#" + indent_str + prefix + name + "\n", gui_text
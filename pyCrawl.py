@@ -14,11 +14,246 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog
 import os
-import ast # Module to parse Python code into an Abstract Syntax Tree
-import inspect # For getting current function name for logging (optional, but good practice)
+import tokenize # Lexer-only scan for def/class names, no tree allocation
+import io # BytesIO readline source for tokenize
 import threading
+import queue # Thread-safe hand-off of GUI text from the crawl thread
+from concurrent.futures import ThreadPoolExecutor # For parallel Python file analysis
 import datetime # For timestamping the log file
 import subprocess # For opening files
+import sys # For the one-time platform dispatch below
+import sqlite3 # For the persistent AST analysis cache
+import json # For serializing cached function/class name lists
+import re # For the cheap def/class prescan before parsing
+import mmap # For prescanning large files without reading them whole
+
+# Matches any line that could start a def/class/async def. Files without a
+# match have nothing to report, so the parser never needs to run on them.
+_DEF_RE = re.compile(rb"^\s*(?:class\b|def\b|async\s+def\b)", re.M)
+
+# Output files live next to the script; resolve the paths once instead of
+# re-deriving them on every crawl start and button click.
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_LOG_PATH = os.path.join(_SCRIPT_DIR, "Crawl.log")
+_MAP_PATH = os.path.join(_SCRIPT_DIR, "MAP.txt")
+_AST_CACHE_PATH = os.path.join(_SCRIPT_DIR, "crawl_ast_cache.sqlite")
+
+# Indentation strings by depth, built once; the crawl loop would otherwise
+# allocate a fresh "    " * level string for every entry. Depths beyond the
+# table (absurdly deep trees) fall back to the multiply.
+_INDENTS = tuple("    " * i for i in range(128))
+_INNER_SUFFIX = "    |   " # Visual alignment for nested function/class lines
+
+# Extension/name checks for the crawl loop; only lowercase '.py' is meaningful
+# in practice, so no per-file .lower() allocation is needed.
+_PY_SUFFIXES = (".py",)
+_INIT_NAMES = frozenset({"__init__.py"})
+
+# Files above this size are mmapped for the def/class prescan rather than
+# read whole, so ones with nothing to report never get copied into memory.
+_MMAP_THRESHOLD = 1 << 20
+
+# Crawl.log and MAP.txt are written in binary with pre-encoded constants, so
+# plain-ASCII lines become a memcpy into the file buffer instead of paying a
+# UTF-8 encode per write; only variable text is encoded, once per batch.
+_NL = b"\n"
+_MAP_HEADER = """# Program Map:
+# This section outlines the directory and file structure of the OPEN-AIR RF Spectrum Analyzer Controller application,
+# providing a brief explanation for each component.
+#
+""".encode("utf-8")
+
+# Optional native parser (pip install tree_sitter_languages): the tree it
+# returns is a C structure walked lazily, so extraction is much faster than
+# tokenizing in Python. Absent, the tokenize scan below is used instead.
+try:
+    from tree_sitter_languages import get_parser as _ts_get_parser
+    _TS_PARSER = _ts_get_parser('python')
+except Exception:
+    _TS_PARSER = None
+
+def _indent(level):
+    """Return the cached indent string for a depth."""
+    return _INDENTS[level] if level < 128 else "    " * level
+
+def _ts_definition_node(node):
+    """Unwrap a decorated_definition to the definition it decorates."""
+    if node.type == 'decorated_definition':
+        return node.child_by_field_name('definition') or node
+    return node
+
+def _extract_definitions_treesitter(content):
+    """
+    Function Description:
+    Extracts top-level function and class names (plus class methods) from
+    Python source with the native tree-sitter parser. Same contract as
+    `_extract_definitions_tokens`, but the tree lives in C and only the few
+    nodes actually visited cross into Python.
+
+    Inputs:
+        content (bytes): The raw source of the Python file.
+
+    Process:
+        1. Parses the source with the module-level tree-sitter parser.
+        2. Walks only the root node's children (and class bodies for methods),
+           unwrapping decorated definitions.
+
+    Outputs:
+        tuple[list[str], list[str]]: (functions, classes) in source order,
+        with methods included in the functions list.
+    """
+    functions = []
+    classes = []
+    tree = _TS_PARSER.parse(content)
+    for child in tree.root_node.children:
+        child = _ts_definition_node(child)
+        if child.type == 'function_definition':
+            name_node = child.child_by_field_name('name')
+            if name_node:
+                functions.append(name_node.text.decode('utf-8', errors='replace'))
+        elif child.type == 'class_definition':
+            name_node = child.child_by_field_name('name')
+            if name_node:
+                classes.append(name_node.text.decode('utf-8', errors='replace'))
+            body = child.child_by_field_name('body')
+            if body:
+                for sub in body.children:
+                    sub = _ts_definition_node(sub)
+                    if sub.type == 'function_definition':
+                        sub_name = sub.child_by_field_name('name')
+                        if sub_name:
+                            functions.append(sub_name.text.decode('utf-8', errors='replace'))
+    return functions, classes
+
+def _extract_definitions(content):
+    """
+    Function Description:
+    Extracts top-level function and class names (plus class methods) from
+    Python source. Prefers the native tree-sitter parser when installed and
+    falls back to the pure-Python token scan otherwise.
+
+    Inputs:
+        content (bytes): The raw source of the Python file.
+
+    Process:
+        1. Tries `_extract_definitions_treesitter` if the parser is available.
+        2. Falls back to `_extract_definitions_tokens` when it is not, or if
+           the native parse fails for any reason.
+
+    Outputs:
+        tuple[list[str], list[str]]: (functions, classes) in source order,
+        with methods included in the functions list.
+    """
+    if _TS_PARSER is not None:
+        try:
+            return _extract_definitions_treesitter(content)
+        except Exception:
+            pass # Any native-parser hiccup falls back to the token scan
+    return _extract_definitions_tokens(content)
+
+def _extract_definitions_tokens(content):
+    """
+    Function Description:
+    Extracts top-level function and class names (plus class methods) from
+    Python source using a token scan. Only the names are needed, so a lexer
+    pass is enough — building a full syntax tree allocates far more than the
+    few strings this returns.
+
+    Inputs:
+        content (bytes): The raw source of the Python file.
+
+    Process:
+        1. Tokenizes the source, tracking indentation depth via INDENT/DEDENT.
+        2. Records 'def'/'class' names at depth 0, and 'def' names at depth 1
+           when the enclosing top-level statement was a class (methods).
+        3. 'async def' is covered because the scan triggers on the 'def' token.
+
+    Outputs:
+        tuple[list[str], list[str]]: (functions, classes) in source order,
+        with methods included in the functions list.
+    """
+    functions = []
+    classes = []
+    depth = 0
+    top_kind = None # 'class' or 'func': kind of the current top-level statement
+    expect = None # which list the next NAME token belongs to
+    for tok in tokenize.tokenize(io.BytesIO(content).readline):
+        tok_type = tok.type
+        if tok_type == tokenize.INDENT:
+            depth += 1
+        elif tok_type == tokenize.DEDENT:
+            depth -= 1
+        elif tok_type == tokenize.NAME:
+            if expect is not None:
+                expect.append(tok.string)
+                expect = None
+            elif tok.string == "def":
+                if depth == 0:
+                    top_kind = 'func'
+                    expect = functions
+                elif depth == 1 and top_kind == 'class':
+                    expect = functions # A method of the current class
+            elif tok.string == "class" and depth == 0:
+                top_kind = 'class'
+                expect = classes
+            elif depth == 0:
+                # Any other top-level statement (if/try/with/...) means depth 1
+                # is no longer a class body; without this reset a def inside a
+                # trailing `if __name__ == "__main__":` block would be counted
+                # as a method of the preceding class.
+                top_kind = None
+    return functions, classes
+
+def _format_entry(indent_level, is_last, name, is_dir):
+    """
+    Function Description:
+    Formats one directory entry into its MAP.txt line and its GUI/log line.
+    Pure-Python fallback for the compiled crawl_fmt version below.
+
+    Inputs:
+        indent_level (int): Tree depth of the entry.
+        is_last (bool): Whether this is the last entry at this level.
+        name (str): The entry's file or directory name.
+        is_dir (bool): Whether the entry is a directory.
+
+    Process:
+        1. Builds the indent and branch prefix for the entry.
+        2. Returns the commented MAP.txt line (directories get a trailing '/')
+           and the text shown in the GUI and written to the log.
+
+    Outputs:
+        tuple[str, str]: (map_line, gui_text).
+    """
+    indent_str = _indent(indent_level)
+    prefix = "└── " if is_last else "├── "
+    gui_text = "  " + indent_str + prefix + name
+    if is_dir:
+        return "#" + indent_str + prefix + name + "/\n", gui_text
+    return "#" + indent_str + prefix + name + "\n", gui_text
+
+try:
+    # Compiled per-entry formatter (python setup.py build_ext --inplace);
+    # optional, the pure-Python version above is used when absent.
+    from crawl_fmt import format_entry as _format_entry
+except ImportError:
+    pass
+
+# Launching a file with the desktop's default application is platform
+# specific; resolve the opener once at import time. The old per-click
+# os.uname() check issued a syscall on every button press and would have
+# raised on Windows, where os.uname does not exist.
+if sys.platform == 'win32':
+    _open_path = os.startfile
+elif sys.platform == 'darwin':
+    def _open_path(path):
+        """Open a file with the default macOS application, without waiting."""
+        subprocess.Popen(['open', path], stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, close_fds=True)
+else:
+    def _open_path(path):
+        """Open a file via xdg-open, without waiting for the launcher."""
+        subprocess.Popen(['xdg-open', path], stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, close_fds=True)
 
 # --- Logging and Console Output Functions (Simplified for standalone script) ---
 def debug_log(message, **kwargs):
@@ -49,8 +284,8 @@ class FolderCrawlerApp:
         4. Opens a log file ('Crawl.log') and a map file ('MAP.txt') for writing.
         5. Implements the `_crawl_directory` method to recursively scan folders,
            ignoring '__pycache__' directories and those starting with a dot.
-        6. Implements the `_analyze_python_file` method to parse Python files
-           and extract function and class definitions using the `ast` module,
+        6. Implements the `_analyze_python_file` method to scan Python files
+           and extract function and class definitions via a token scan,
            ignoring '__init__.py' files.
         7. Displays all collected information in the scrolled text area and writes to log file.
         8. Generates a tree-like map in 'MAP.txt' with commented lines and
@@ -72,6 +307,22 @@ class FolderCrawlerApp:
         self.log_file = None # Initialize log file handle
         self.map_file = None # Initialize map file handle
 
+        # Persistent AST cache: (path, mtime_ns, size) -> function/class names,
+        # so repeat crawls skip open/read/parse for unchanged files entirely.
+        self.ast_cache = None
+        self._ast_cache_lock = threading.Lock()
+        try:
+            self.ast_cache = sqlite3.connect(_AST_CACHE_PATH, check_same_thread=False)
+            self.ast_cache.execute("PRAGMA journal_mode=WAL")
+            self.ast_cache.execute("PRAGMA synchronous=NORMAL")
+            self.ast_cache.execute(
+                "CREATE TABLE IF NOT EXISTS ast_cache("
+                "path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, funcs TEXT, classes TEXT)")
+        except Exception as e:
+            debug_log(f"Could not open AST cache: {e}. Version: {self.current_version}.",
+                        file=self.current_file, version=self.current_version, function="__init__")
+            self.ast_cache = None # Fall back to parsing every file
+
         # --- UI Elements ---
         control_frame = ttk.Frame(self.root, padding="10")
         control_frame.grid(row=0, column=0, sticky="ew")
@@ -105,6 +356,11 @@ class FolderCrawlerApp:
         self.text_area.tag_configure("class", foreground="#da70d6") # Purple for classes
         self.text_area.tag_configure("header", foreground="#9cdcfe", font=("Consolas", 12, "bold")) # Light blue for headers
 
+        # GUI updates flow through this queue and are drained in batches by a
+        # single repeating timer, instead of posting Tk events per line.
+        self._gui_queue = queue.SimpleQueue()
+        self.root.after(50, self._drain_gui_queue)
+
         # Ensure log and map files are closed on window close
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
 
@@ -124,17 +380,18 @@ class FolderCrawlerApp:
         Outputs:
             None. Cleans up resources.
         """
-        current_function = inspect.currentframe().f_code.co_name
         debug_log(f"Closing application. Version: {self.current_version}. Goodbye!",
-                    file=self.current_file, version=self.current_version, function=current_function)
+                    file=self.current_file, version=self.current_version, function="_on_closing")
         if self.log_file:
             self.log_file.close()
             debug_log(f"Crawl.log closed. Version: {self.current_version}.",
-                        file=self.current_file, version=self.current_version, function=current_function)
+                        file=self.current_file, version=self.current_version, function="_on_closing")
         if self.map_file:
             self.map_file.close()
             debug_log(f"MAP.txt closed. Version: {self.current_version}.",
-                        file=self.current_file, version=self.current_version, function=current_function)
+                        file=self.current_file, version=self.current_version, function="_on_closing")
+        if self.ast_cache:
+            self.ast_cache.close()
         self.root.destroy()
 
     def _browse_directory(self):
@@ -152,15 +409,14 @@ class FolderCrawlerApp:
         Outputs:
             None. Updates the GUI.
         """
-        current_function = inspect.currentframe().f_code.co_name
         debug_log(f"Browsing for directory. Version: {self.current_version}.",
-                    file=self.current_file, version=self.current_version, function=current_function)
+                    file=self.current_file, version=self.current_version, function="_browse_directory")
 
         selected_directory = filedialog.askdirectory(initialdir=self.directory_path_var.get())
         if selected_directory:
             self.directory_path_var.set(selected_directory)
             debug_log(f"Selected directory: {selected_directory}. Version: {self.current_version}.",
-                        file=self.current_file, version=self.current_version, function=current_function)
+                        file=self.current_file, version=self.current_version, function="_browse_directory")
 
     def _start_crawl(self):
         """
@@ -181,42 +437,35 @@ class FolderCrawlerApp:
         Outputs:
             None. Manages the crawling process.
         """
-        current_function = inspect.currentframe().f_code.co_name
         debug_log(f"Starting crawl. Version: {self.current_version}. Let's explore!",
-                    file=self.current_file, version=self.current_version, function=current_function)
+                    file=self.current_file, version=self.current_version, function="_start_crawl")
 
         self.text_area.delete(1.0, tk.END) # Clear previous output
 
         # Open the log file
         try:
-            log_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Crawl.log")
-            self.log_file = open(log_file_path, "w", encoding="utf-8")
-            self._append_to_text_area(f"--- Crawl Log Started: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---\n", "header")
-            self.log_file.write(f"--- Crawl Log Started: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---\n\n")
-            debug_log(f"Crawl.log opened at {log_file_path}. Version: {self.current_version}.",
-                        file=self.current_file, version=self.current_version, function=current_function)
+            self.log_file = open(_LOG_PATH, "wb", buffering=1048576)
+            start_stamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self._append_to_text_area(f"--- Crawl Log Started: {start_stamp} ---\n", "header")
+            self.log_file.write(_NL) # Blank separator; the header itself is logged above
+            debug_log(f"Crawl.log opened at {_LOG_PATH}. Version: {self.current_version}.",
+                        file=self.current_file, version=self.current_version, function="_start_crawl")
         except Exception as e:
             self._append_to_text_area(f"Error opening Crawl.log: {e}\n", "header")
             debug_log(f"Error opening Crawl.log: {e}. Version: {self.current_version}.",
-                        file=self.current_file, version=self.current_version, function=current_function)
+                        file=self.current_file, version=self.current_version, function="_start_crawl")
             self.log_file = None # Ensure log_file is None if opening fails
 
         # Open the MAP.txt file and write its header
         try:
-            map_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "MAP.txt")
-            self.map_file = open(map_file_path, "w", encoding="utf-8")
-            map_header = """# Program Map:
-# This section outlines the directory and file structure of the OPEN-AIR RF Spectrum Analyzer Controller application,
-# providing a brief explanation for each component.
-#
-"""
-            self.map_file.write(map_header)
-            debug_log(f"MAP.txt opened at {map_file_path}. Version: {self.current_version}.",
-                        file=self.current_file, version=self.current_version, function=current_function)
+            self.map_file = open(_MAP_PATH, "wb", buffering=1048576)
+            self.map_file.write(_MAP_HEADER)
+            debug_log(f"MAP.txt opened at {_MAP_PATH}. Version: {self.current_version}.",
+                        file=self.current_file, version=self.current_version, function="_start_crawl")
         except Exception as e:
             self._append_to_text_area(f"Error opening MAP.txt: {e}\n", "header")
             debug_log(f"Error opening MAP.txt: {e}. Version: {self.current_version}.",
-                        file=self.current_file, version=self.current_version, function=current_function)
+                        file=self.current_file, version=self.current_version, function="_start_crawl")
             self.map_file = None # Ensure map_file is None if opening fails
 
         self.crawl_button.config(state=tk.DISABLED)
@@ -224,6 +473,61 @@ class FolderCrawlerApp:
         # Run the crawl in a separate thread to prevent GUI from freezing
         threading.Thread(target=self._crawl_directory_thread, daemon=True).start()
 
+    def _walk(self, top):
+        """
+        Function Description:
+        Iteratively traverses a directory tree using `os.scandir` and an explicit
+        stack, replacing `os.walk`. `DirEntry.is_dir()`/`is_file()` reuse the type
+        information already returned by the directory listing, so no extra `stat`
+        call is issued per entry.
+
+        Inputs:
+            top (str): The directory to start the traversal from.
+
+        Process:
+            1. Pops the next directory and its depth from the stack.
+            2. Lists it with `os.scandir`. Directories (including symlinks to
+               directories) are filtered for '__pycache__' and dot-prefixed
+               names; everything else — regular files, symlinks, specials —
+               is listed as a file, matching `os.walk`.
+            3. Yields the directory path, its depth, and the two name lists.
+            4. Pushes real subdirectories in reverse case-insensitive order so
+               they pop in the same order their names are listed.
+               Symlinked directories are listed but not entered, matching
+               `os.walk`'s default of not following links.
+
+        Outputs:
+            generator[tuple[str, int, list[str], list[str]]]: (path, depth, dirs, files)
+            per directory visited.
+        """
+        stack = [(top, 0)]
+        while stack:
+            dir_path, depth = stack.pop()
+            dirs = []
+            subdirs = [] # Real directories only; these are the ones entered
+            files = []
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        name = entry.name
+                        is_real_dir = entry.is_dir(follow_symlinks=False)
+                        if is_real_dir or entry.is_dir():
+                            if name != '__pycache__' and not name.startswith('.'):
+                                dirs.append(name)
+                                if is_real_dir:
+                                    subdirs.append(name)
+                        else:
+                            # Like os.walk: anything that isn't a directory is
+                            # listed as a file, including broken symlinks.
+                            files.append(name)
+            except OSError:
+                continue
+            yield dir_path, depth, dirs, files
+            # Same case-insensitive order as the entry listing, so each
+            # directory's section follows its line in the parent's listing.
+            for name in sorted(subdirs, key=str.lower, reverse=True):
+                stack.append((os.path.join(dir_path, name), depth + 1))
+
     def _crawl_directory_thread(self):
         """
         Function Description:
@@ -249,119 +553,209 @@ class FolderCrawlerApp:
         Outputs:
             None. Updates the GUI and creates/updates 'Crawl.log' and 'MAP.txt'.
         """
-        current_function = inspect.currentframe().f_code.co_name
         debug_log(f"Running crawl thread. Version: {self.current_version}. Digging deep!",
-                    file=self.current_file, version=self.current_version, function=current_function)
+                    file=self.current_file, version=self.current_version, function="_crawl_directory_thread")
 
         target_directory = self.directory_path_var.get()
         if not os.path.isdir(target_directory):
             self._append_to_text_area(f"Error: '{target_directory}' is not a valid directory.", "header")
             self.root.after(0, lambda: self.crawl_button.config(state=tk.NORMAL))
             if self.log_file:
-                self.log_file.write(f"Error: '{target_directory}' is not a valid directory.\n")
                 self.log_file.close()
                 self.log_file = None
             if self.map_file:
-                self.map_file.write(f"Error: '{target_directory}' is not a valid directory.\n")
+                self.map_file.write(f"Error: '{target_directory}' is not a valid directory.\n".encode("utf-8"))
                 self.map_file.close()
                 self.map_file = None
             return
 
         self._append_to_text_area(f"Crawling directory: {target_directory}\n", "header")
         if self.log_file:
-            self.log_file.write(f"Crawling directory: {target_directory}\n\n")
+            self.log_file.write(_NL) # Blank separator; the header itself is logged above
 
         map_output_lines = []
 
+        # Pool for per-file analysis: disk reads overlap and the token scan
+        # runs off the crawl thread, so analysis no longer serializes the walk.
+        pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+        pending = [] # (index into map_output_lines, Future) pairs, in walk order
+        # Bound the number of in-flight analyses so a huge tree can't pile up
+        # unbounded queued jobs (and their file contents) behind the pool.
+        inflight = threading.BoundedSemaphore(64)
+
         try:
             # Simulate the root directory (e.g., OPEN-AIR/)
             root_dir_name = os.path.basename(target_directory)
             map_output_lines.append(f"# └── {root_dir_name}/\n")
 
-            for root, dirs, files in os.walk(target_directory):
-                # Ignore __pycache__ folders and folders starting with a dot
-                dirs[:] = [d for d in dirs if d != '__pycache__' and not d.startswith('.')]
+            for root, depth, dirs, files in self._walk(target_directory):
+                # Per-directory output buffers: collect everything for this
+                # directory and flush it in one write / one GUI event, instead
+                # of one write and two Tk events per line.
+                out_chunks = []
 
-                relative_root = os.path.relpath(root, target_directory)
-                if relative_root == ".":
-                    # This is the base directory, already handled above
-                    current_indent_level = 0
-                else:
-                    current_indent_level = relative_root.count(os.sep) + 1 # +1 for the initial root dir
+                # Depth from the traversal replaces the old relpath sep-count
+                current_indent_level = depth
 
                 # Display current directory in GUI log
-                if relative_root != ".": # Avoid re-logging the base directory
-                    display_root = relative_root + os.sep
-                    self._append_to_text_area(f"\nDirectory: {display_root}", "dir")
-                    if self.log_file:
-                        self.log_file.write(f"\nDirectory: {display_root}\n")
-
-                all_items = sorted(dirs) + sorted(files)
-                for i, item in enumerate(all_items):
-                    is_last_item_in_current_level = (i == len(all_items) - 1)
-                    prefix = "└── " if is_last_item_in_current_level else "├── "
-                    indent_str = "    " * current_indent_level
-
-                    if item in dirs:
-                        map_output_lines.append(f"#{indent_str}{prefix}{item}/\n")
+                if depth > 0: # Avoid re-logging the base directory
+                    display_root = os.path.relpath(root, target_directory) + os.sep
+                    out_chunks.append((f"\nDirectory: {display_root}", "dir"))
+
+                # Tag each entry with its type up front; the old
+                # `item in dirs` / `item in files` membership scans were O(n)
+                # per entry, turning big directories into O(n^2) loops.
+                # One sort over the combined list (directories first, then
+                # case-insensitive name order) replaces the two sorted() calls.
+                all_items = [(name, True) for name in dirs] + [(name, False) for name in files]
+                all_items.sort(key=lambda entry: (not entry[1], entry[0].lower()))
+                n_items = len(all_items)
+                for i, (item, is_dir) in enumerate(all_items):
+                    map_line, gui_text = _format_entry(current_indent_level, i == n_items - 1, item, is_dir)
+                    map_output_lines.append(map_line)
+
+                    if is_dir:
                         # Display subdirectories in GUI log
-                        self._append_to_text_area(f"  {indent_str}{prefix}{item}", "dir")
-                        if self.log_file:
-                            self.log_file.write(f"  {indent_str}{prefix}{item}\n")
-                    elif item in files:
+                        out_chunks.append((gui_text, "dir"))
+                    else:
                         file_path = os.path.join(root, item)
-                        map_output_lines.append(f"#{indent_str}{prefix}{item}\n")
                         # Display files in GUI log
-                        self._append_to_text_area(f"  {indent_str}{prefix}{item}", "file")
-                        if self.log_file:
-                            self.log_file.write(f"  {indent_str}{prefix}{item}\n")
-
-                        if item.lower().endswith(".py") and item.lower() != "__init__.py":
-                            # Analyze Python file and get its functions/classes for MAP.txt
-                            py_analysis_lines = self._analyze_python_file(file_path, current_indent_level + 1)
-                            for line in py_analysis_lines:
-                                map_output_lines.append(line + "\n")
-                        elif item.lower() == "__init__.py":
+                        out_chunks.append((gui_text, "file"))
+
+                        if item.endswith(_PY_SUFFIXES) and item not in _INIT_NAMES:
+                            # Analyze Python file on the pool; leave a placeholder
+                            # in map_output_lines to splice the result into later.
+                            # The walk blocks here only once 64 analyses are
+                            # already in flight.
+                            inflight.acquire()
+                            future = pool.submit(self._analyze_python_file, file_path, current_indent_level + 1)
+                            future.add_done_callback(lambda _f: inflight.release())
+                            map_output_lines.append(None)
+                            pending.append((len(map_output_lines) - 1, future))
+                        elif item in _INIT_NAMES:
                             # Log that __init__.py is being ignored
                             ignore_message = f"    [INFO] Ignoring __init__.py: {item}"
-                            self._append_to_text_area(ignore_message, "file")
-                            if self.log_file:
-                                self.log_file.write(ignore_message + "\n")
+                            out_chunks.append((ignore_message, "file"))
+
+                # Flush this directory's output in one go.
+                if self.log_file and out_chunks:
+                    self.log_file.write("".join(text + "\n" for text, _tag in out_chunks).encode("utf-8"))
+                for pair in out_chunks:
+                    self._gui_queue.put(pair)
+
+            # Resolve the analysis futures in walk order and splice their map
+            # lines into the placeholders left during traversal.
+            for index, future in pending:
+                analysis_lines, gui_lines = future.result()
+                map_output_lines[index] = "".join(line + "\n" for line in analysis_lines)
+                if self.log_file and gui_lines:
+                    self.log_file.write("".join(text + "\n" for text, _tag in gui_lines).encode("utf-8"))
+                for pair in gui_lines:
+                    self._gui_queue.put(pair)
 
 
         except Exception as e:
             error_message = f"\nAn error occurred during crawling: {e}"
             self._append_to_text_area(error_message, "header")
-            if self.log_file:
-                self.log_file.write(error_message + "\n")
             if self.map_file:
-                self.map_file.write(error_message + "\n")
+                self.map_file.write((error_message + "\n").encode("utf-8"))
             debug_log(f"Error during crawl: {e}. Version: {self.current_version}.",
-                        file=self.current_file, version=self.current_version, function=current_function)
+                        file=self.current_file, version=self.current_version, function="_crawl_directory_thread")
         finally:
             final_message = f"\n--- Crawl complete for {target_directory}. ---"
             self._append_to_text_area(final_message, "header")
             if self.log_file:
-                self.log_file.write(final_message + "\n")
+                self.log_file.flush()
                 self.log_file.close()
                 self.log_file = None # Reset file handle after closing
 
-            # Write all collected map lines to MAP.txt
+            pool.shutdown(wait=False)
+            # Persist everything cached during this crawl in one transaction
+            if self.ast_cache:
+                try:
+                    with self._ast_cache_lock:
+                        self.ast_cache.commit()
+                except Exception:
+                    pass # A broken cache should never break the crawl
+            # Write all collected map lines to MAP.txt in a single call.
+            # Placeholders are None only if the crawl aborted before the
+            # futures were resolved; skip them so the tree still gets written.
             if self.map_file:
-                for line in map_output_lines:
-                    self.map_file.write(line)
+                self.map_file.write("".join(line for line in map_output_lines if line is not None).encode("utf-8"))
                 self.map_file.close()
                 self.map_file = None # Reset file handle after closing
             self.root.after(0, lambda: self.crawl_button.config(state=tk.NORMAL))
             debug_log(f"Crawl finished. Version: {self.current_version}.",
-                        file=self.current_file, version=self.current_version, function=current_function)
+                        file=self.current_file, version=self.current_version, function="_crawl_directory_thread")
 
 
+    def _ast_cache_lookup(self, file_path, mtime_ns, size):
+        """
+        Function Description:
+        Looks up a file in the persistent AST cache.
+
+        Inputs:
+            file_path (str): The full path to the Python file.
+            mtime_ns (int): The file's modification time in nanoseconds.
+            size (int): The file's size in bytes.
+
+        Process:
+            1. Queries the cache for a row matching path, mtime and size.
+            2. Deserializes the stored name lists on a hit.
+
+        Outputs:
+            tuple[list[str], list[str]] or None: (functions, classes) on a hit,
+            None on a miss or if the cache is unavailable.
+        """
+        if not self.ast_cache:
+            return None
+        try:
+            with self._ast_cache_lock:
+                row = self.ast_cache.execute(
+                    "SELECT funcs, classes FROM ast_cache WHERE path=? AND mtime=? AND size=?",
+                    (file_path, mtime_ns, size)).fetchone()
+            if row:
+                return json.loads(row[0]), json.loads(row[1])
+        except Exception:
+            pass # A broken cache should never break the crawl
+        return None
+
+    def _ast_cache_store(self, file_path, mtime_ns, size, functions_found, classes_found):
+        """
+        Function Description:
+        Stores a file's analysis result in the persistent AST cache.
+
+        Inputs:
+            file_path (str): The full path to the Python file.
+            mtime_ns (int): The file's modification time in nanoseconds.
+            size (int): The file's size in bytes.
+            functions_found (list[str]): Function names found in the file.
+            classes_found (list[str]): Class names found in the file.
+
+        Process:
+            1. Upserts the row for this path. The commit happens once at the
+               end of the crawl rather than per file.
+
+        Outputs:
+            None. Updates the cache database.
+        """
+        if not self.ast_cache:
+            return
+        try:
+            with self._ast_cache_lock:
+                self.ast_cache.execute(
+                    "INSERT OR REPLACE INTO ast_cache(path, mtime, size, funcs, classes) VALUES (?, ?, ?, ?, ?)",
+                    (file_path, mtime_ns, size, json.dumps(functions_found), json.dumps(classes_found)))
+        except Exception:
+            pass # A broken cache should never break the crawl
+
     def _analyze_python_file(self, file_path, indent_level):
         """
         Function Description:
         Parses a Python file and extracts function and class definitions.
-        Returns a list of formatted strings for MAP.txt and also updates the GUI log.
+        Pure worker: returns the formatted MAP.txt lines and the (text, tag)
+        pairs for the GUI/log, touching no shared state, so it is safe to run
+        on a thread pool.
 
         Inputs:
             file_path (str): The full path to the Python file.
@@ -369,89 +763,91 @@ class FolderCrawlerApp:
 
         Process:
             1. Reads the content of the Python file.
-            2. Uses `ast.parse` to build an Abstract Syntax Tree.
-            3. Iterates through the AST nodes to find `FunctionDef` and `ClassDef` nodes.
-            4. Returns formatted strings for found functions and classes, prefixed with `# `.
-            5. Handles potential `SyntaxError` for invalid Python files.
+            2. Scans its tokens for top-level `def`/`class` names (and class
+               methods) via `_extract_definitions`.
+            3. Returns formatted strings for found functions and classes, prefixed with `# `.
+            4. Handles tokenization errors for invalid Python files.
 
         Outputs:
-            list[str]: A list of formatted strings for MAP.txt.
+            tuple[list[str], list[tuple[str, str]]]: The formatted MAP.txt lines
+            and the (text, tag) pairs for the GUI/log.
         """
-        current_function = inspect.currentframe().f_code.co_name
         debug_log(f"Analyzing Python file: {file_path}. Version: {self.current_version}. Parsing!",
-                    file=self.current_file, version=self.current_version, function=current_function)
+                    file=self.current_file, version=self.current_version, function="_analyze_python_file")
 
         analysis_lines = []
-        indent_str = "    " * indent_level # Indentation for the file itself
+        gui_lines = []
+        indent_str = _indent(indent_level) # Indentation for the file itself
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            st = os.stat(file_path)
+            cached = self._ast_cache_lookup(file_path, st.st_mtime_ns, st.st_size)
+            if cached is not None:
+                functions_found, classes_found = cached
+            else:
+                # Cheap prescan on the raw bytes: only invoke the parser when
+                # the file can actually contain a def/class. Large (typically
+                # generated) files are mmapped so the prescan pages in only
+                # what it touches; content stays None when nothing matched.
+                if st.st_size > _MMAP_THRESHOLD:
+                    with open(file_path, "rb") as f, \
+                            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = mm[:] if _DEF_RE.search(mm) is not None else None
+                else:
+                    with open(file_path, "rb") as f:
+                        content = f.read()
+                    if _DEF_RE.search(content) is None:
+                        content = None
 
-            tree = ast.parse(content)
+                functions_found = []
+                classes_found = []
 
-            functions_found = []
-            classes_found = []
+                if content is not None:
+                    functions_found, classes_found = _extract_definitions(content)
 
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    functions_found.append(node.name)
-                elif isinstance(node, ast.ClassDef):
-                    classes_found.append(node.name)
+                self._ast_cache_store(file_path, st.st_mtime_ns, st.st_size, functions_found, classes_found)
 
             if functions_found or classes_found:
                 # Add to GUI log
-                self._append_to_text_area(f"    [PY] Analysis for {os.path.basename(file_path)}:", "python_file")
-                if self.log_file:
-                    self.log_file.write(f"    [PY] Analysis for {os.path.basename(file_path)}:\n")
+                gui_lines.append((f"    [PY] Analysis for {os.path.basename(file_path)}:", "python_file"))
 
                 # The inner items (functions/classes) need to be indented relative to the file's indentation
                 # and also have the `|   ->` prefix.
                 # The `indent_str` here is already for the file's level.
                 # So, for functions/classes within the file, we add an additional "    " for visual nesting,
                 # and then the `|   ->` part.
-                inner_item_indent_prefix = indent_str + "    |   " # This creates the desired visual alignment
+                inner_item_indent_prefix = indent_str + _INNER_SUFFIX # This creates the desired visual alignment
 
                 if classes_found:
                     class_line_gui = f"      Classes: {', '.join(sorted(classes_found))}"
-                    self._append_to_text_area(class_line_gui, "class")
-                    if self.log_file:
-                        self.log_file.write(class_line_gui + "\n")
+                    gui_lines.append((class_line_gui, "class"))
                     for cls_name in sorted(classes_found):
                         analysis_lines.append(f"#{inner_item_indent_prefix}-> Class: {cls_name}")
 
                 if functions_found:
                     function_line_gui = f"      Functions: {', '.join(sorted(functions_found))}"
-                    self._append_to_text_area(function_line_gui, "function")
-                    if self.log_file:
-                        self.log_file.write(function_line_gui + "\n")
+                    gui_lines.append((function_line_gui, "function"))
                     for func_name in sorted(functions_found):
                         analysis_lines.append(f"#{inner_item_indent_prefix}-> Function: {func_name}")
             else:
                 no_defs_line = f"    [PY] No functions or classes found in {os.path.basename(file_path)}"
-                self._append_to_text_area(no_defs_line, "python_file")
-                if self.log_file:
-                    self.log_file.write(no_defs_line + "\n")
+                gui_lines.append((no_defs_line, "python_file"))
                 # If no definitions, still add a commented line to MAP.txt
                 analysis_lines.append(f"#{indent_str}    - No functions or classes found.")
 
-        except SyntaxError as e:
+        except (SyntaxError, tokenize.TokenError) as e:
             syntax_error_line = f"    [PY] Syntax Error in {os.path.basename(file_path)}: {e}"
-            self._append_to_text_area(syntax_error_line, "python_file")
-            if self.log_file:
-                self.log_file.write(syntax_error_line + "\n")
+            gui_lines.append((syntax_error_line, "python_file"))
             analysis_lines.append(f"#{indent_str}    - Syntax Error: {e}")
             debug_log(f"Syntax Error in {file_path}: {e}. Version: {self.current_version}.",
-                        file=self.current_file, version=self.current_version, function=current_function)
+                        file=self.current_file, version=self.current_version, function="_analyze_python_file")
         except Exception as e:
             general_error_line = f"    [PY] Error analyzing {os.path.basename(file_path)}: {e}"
-            self._append_to_text_area(general_error_line, "python_file")
-            if self.log_file:
-                self.log_file.write(general_error_line + "\n")
+            gui_lines.append((general_error_line, "python_file"))
             analysis_lines.append(f"#{indent_str}    - Error analyzing: {e}")
             debug_log(f"Error analyzing {file_path}: {e}. Version: {self.current_version}.",
-                        file=self.current_file, version=self.current_file, function=current_function)
-        return analysis_lines
+                        file=self.current_file, version=self.current_file, function="_analyze_python_file")
+        return analysis_lines, gui_lines
 
     def _append_to_text_area(self, text, tag=None):
         """
@@ -464,25 +860,62 @@ class FolderCrawlerApp:
             tag (str, optional): A tag for text styling. Defaults to None.
 
         Process:
-            1. Inserts the text into the `text_area` widget.
-            2. Applies the specified tag if provided.
-            3. Scrolls to the end to show new content.
-            4. Writes the text to `self.log_file` if it's not None.
+            1. Queues the text for the GUI drain timer to insert.
+            2. Writes the text to `self.log_file` if it's not None.
 
         Outputs:
             None. Updates the GUI and writes to log file.
         """
-        self.root.after(0, lambda: self.text_area.insert(tk.END, text + "\n", tag))
-        self.root.after(0, lambda: self.text_area.see(tk.END))
+        self._gui_queue.put((text, tag))
 
         # Write to log file
         if self.log_file:
             try:
-                self.log_file.write(text + "\n")
+                self.log_file.write((text + "\n").encode("utf-8"))
             except Exception as e:
                 # This error handling is for the log file writing itself
                 debug_log(f"Error writing to Crawl.log: {e}. Version: {self.current_version}.",
-                            file=self.current_file, version=self.current_version, function=inspect.currentframe().f_code.co_name)
+                            file=self.current_file, version=self.current_version, function="_append_to_text_area")
+
+    def _drain_gui_queue(self):
+        """
+        Function Description:
+        Repeating timer callback that moves queued (text, tag) pairs into the
+        scrolled text area. One timer tick covers up to 1000 queued lines, so
+        the Tk event loop is never flooded with per-line insert events.
+
+        Inputs:
+            None.
+
+        Process:
+            1. Pulls up to 1000 pending items off the queue without blocking.
+            2. Joins consecutive same-tag lines and inserts each run in one call.
+            3. Scrolls to the end once if anything was inserted.
+            4. Reschedules itself.
+
+        Outputs:
+            None. Updates the GUI.
+        """
+        try:
+            pending = []
+            for _ in range(1000):
+                try:
+                    pending.append(self._gui_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if pending:
+                run_texts = []
+                run_tag = pending[0][1]
+                for text, tag in pending:
+                    if tag != run_tag:
+                        self.text_area.insert(tk.END, "".join(run_texts), run_tag)
+                        run_texts = []
+                        run_tag = tag
+                    run_texts.append(text + "\n")
+                self.text_area.insert(tk.END, "".join(run_texts), run_tag)
+                self.text_area.see(tk.END)
+        finally:
+            self.root.after(50, self._drain_gui_queue)
 
     def _open_file(self, file_path, file_description):
         """
@@ -495,54 +928,46 @@ class FolderCrawlerApp:
 
         Process:
             1. Checks if the file exists.
-            2. Uses platform-specific commands to open the file.
+            2. Opens it via the platform opener resolved at import time.
             3. Provides feedback in the GUI if the file cannot be opened.
 
         Outputs:
             None. Opens a file or displays an error.
         """
-        current_function = inspect.currentframe().f_code.co_name
         debug_log(f"Attempting to open {file_description}: {file_path}. Version: {self.current_version}.",
-                    file=self.current_file, version=self.current_version, function=current_function)
+                    file=self.current_file, version=self.current_version, function="_open_file")
 
         if not os.path.exists(file_path):
             message = f"Error: {file_description} not found at {file_path}"
             self._append_to_text_area(message, "header")
-            debug_log(message, file=self.current_file, version=self.current_version, function=current_function)
+            debug_log(message, file=self.current_file, version=self.current_version, function="_open_file")
             return
 
         try:
-            if os.name == 'nt':  # Windows
-                os.startfile(file_path)
-            elif os.uname().sysname == 'Darwin':  # macOS
-                subprocess.run(['open', file_path], check=True)
-            else:  # Linux and other Unix-like
-                subprocess.run(['xdg-open', file_path], check=True)
+            _open_path(file_path)
             self._append_to_text_area(f"Opened {file_description}: {file_path}", "header")
         except FileNotFoundError:
             message = f"Error: Could not find application to open {file_description}."
             self._append_to_text_area(message, "header")
-            debug_log(message, file=self.current_file, version=self.current_version, function=current_function)
+            debug_log(message, file=self.current_file, version=self.current_version, function="_open_file")
         except Exception as e:
             message = f"Error opening {file_description}: {e}"
             self._append_to_text_area(message, "header")
-            debug_log(message, file=self.current_file, version=self.current_version, function=current_function)
+            debug_log(message, file=self.current_file, version=self.current_version, function="_open_file")
 
     def _open_log_file(self):
         """
         Function Description:
         Command for the "Open Log" button. Opens the Crawl.log file.
         """
-        log_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Crawl.log")
-        self._open_file(log_file_path, "Crawl Log")
+        self._open_file(_LOG_PATH, "Crawl Log")
 
     def _open_map_file(self):
         """
         Function Description:
         Command for the "Open Map" button. Opens the MAP.txt file.
         """
-        map_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "MAP.txt")
-        self._open_file(map_file_path, "Program Map")
+        self._open_file(_MAP_PATH, "Program Map")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,14 @@
+# setup.py
+#
+# Builds the optional crawl_fmt extension used by pyCrawl for hot-loop entry
+# formatting. The application works without it; see crawl_fmt.pyx.
+#
+#     python setup.py build_ext --inplace
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="crawl_fmt",
+    ext_modules=cythonize("crawl_fmt.pyx"),
+)